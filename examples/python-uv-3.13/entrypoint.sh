@@ -9,11 +9,13 @@ set -e
 #
 # Environment Variables:
 #   NO_COLORS         - Set to "1" or "true" to disable color output
-#   BROWSER           - Browser to use (firefox, chromium, webkit)
+#   BROWSER           - Browser to use (firefox, chromium, webkit, chrome)
 #   DISPLAY           - X11 display number (default: :99)
 #   XVFB_RESOLUTION   - Xvfb screen resolution (default: 1280x1024x24)
 #   PYTEST_VERBOSE    - Pytest verbosity flag (default: -vv)
 #   PYTEST_TRACEBACK  - Pytest traceback style (default: long)
+#   PYTEST_WORKERS    - pytest-xdist workers, e.g. auto or 4 (default: auto;
+#                       0 or empty runs serially with live log output)
 # ============================================================================
 
 # Initialize exit code
@@ -94,7 +96,10 @@ printf "\n"
 # Check for browser (configurable via BROWSER env var)
 BROWSER="${BROWSER:-firefox}"
 print_section "🌐 Browser Installation Check (${BROWSER}):"
-if .venv/bin/playwright install --list 2>&1 | grep -q "$BROWSER"; then
+# Google Chrome (channel) is installed system-wide, not in the Playwright cache
+if [[ "$BROWSER" == "chrome" ]] && command -v google-chrome >/dev/null 2>&1; then
+  printf "   %s✓ %s browser installed%s\n" "$GREEN" "$BROWSER" "$NC"
+elif .venv/bin/playwright install --list 2>&1 | grep -q "$BROWSER"; then
   printf "   %s✓ %s browser installed%s\n" "$GREEN" "$BROWSER" "$NC"
 else
   printf "   %s✗ %s browser NOT installed%s\n" "$RED" "$BROWSER" "$NC"
@@ -174,6 +179,12 @@ if [[ $# -eq 0 ]]; then
     PYTEST_CMD+=("--tb=$PYTEST_TRACEBACK")
   fi
 
+  # Run test files in parallel if set (e.g., PYTEST_WORKERS=auto)
+  # --dist loadfile keeps each file on one worker with its own session browser
+  if [[ -n "${PYTEST_WORKERS:-}" ]] && [[ "${PYTEST_WORKERS}" != "0" ]]; then
+    PYTEST_CMD+=(-n "$PYTEST_WORKERS" --dist loadfile)
+  fi
+
   # Add default test directory
   PYTEST_CMD+=(tests/)
 
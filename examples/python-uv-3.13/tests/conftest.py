@@ -1,40 +1,195 @@
-"""Pytest configuration with FUNCTION-SCOPED fixtures (testing hypothesis)."""
+"""Pytest configuration with a SESSION-SCOPED browser shared by all tests."""
+
+import os
+from pathlib import Path
 
 import pytest
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+import pytest_asyncio
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    BrowserType,
+    Playwright,
+    Route,
+)
 
+# Storage state with Google's cookie consent already accepted
+GOOGLE_CONSENT_STATE = Path(__file__).parent / "storage" / "google_consent.json"
 
-@pytest.fixture
-async def browser():
-    """Create and manage a browser instance for EACH TEST (function scope).
+# Requests no test asserts on: aborting them lets the load event fire sooner
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_HOSTS = (
+    "doubleclick.net",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "googlesyndication.com",
+)
 
-    This avoids session-scoped async fixture issues with pytest-asyncio.
-    """
+# $BROWSER values launched as a Chromium channel, i.e. a system-installed
+# browser (e.g. via `playwright install chrome`) instead of the bundled Chromium
+CHROMIUM_CHANNELS = {"chrome"}
+
+# Accepted $BROWSER values
+SUPPORTED_BROWSERS = {"chromium", "firefox", "webkit"} | CHROMIUM_CHANNELS
+
+# CI flag set for Chromium-based browsers: keeps the browser from starting
+# background traffic (sync, translate, safe browsing, ...) that competes with tests
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-breakpad",
+    "--disable-client-side-phishing-detection",
+    "--disable-default-apps",
+    "--disable-hang-monitor",
+    "--disable-ipc-flooding-protection",
+    "--disable-popup-blocking",
+    "--disable-prompt-on-repost",
+    "--disable-renderer-backgrounding",
+    "--disable-sync",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--safebrowsing-disable-auto-update",
+    "--enable-automation",
+    "--password-store=basic",
+]
+
+# Options shared by every browser context
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 720},
+    # Pin the language so sites serve English pages regardless of runner locale
+    "extra_http_headers": {"Accept-Language": "en-US,en;q=0.9"},
+}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def playwright():
+    """Start the Playwright driver ONCE for the whole test session."""
     async with async_playwright() as p:
-        browser = await p.firefox.launch(
-            headless=True,
-            timeout=30000,  # 30 second browser launch timeout
+        yield p
+
+
+def _browser_name() -> str:
+    """Return the browser selected via $BROWSER (default: firefox).
+
+    It must match the browser installed in the Docker image. ``all`` (the
+    multi-browser image) and an empty value fall back to firefox.
+    """
+    browser_name = os.environ.get("BROWSER", "").strip() or "firefox"
+    if browser_name == "all":
+        return "firefox"
+    if browser_name not in SUPPORTED_BROWSERS:
+        raise pytest.UsageError(
+            f"Unsupported BROWSER={browser_name!r}; "
+            f"expected one of: {', '.join(sorted(SUPPORTED_BROWSERS))}, all"
         )
-        yield browser
-        await browser.close()
+    return browser_name
+
+
+def _browser_type(playwright: Playwright) -> BrowserType:
+    """Return the Playwright browser type for the selected browser."""
+    browser_name = _browser_name()
+    if browser_name in CHROMIUM_CHANNELS:
+        return playwright.chromium
+    return getattr(playwright, browser_name)
+
+
+def _launch_options() -> dict:
+    """Return the options for launching the session browser."""
+    options = {
+        "headless": True,
+        "timeout": 30000,  # 30 second browser launch timeout
+    }
+    browser_name = _browser_name()
+    if browser_name in CHROMIUM_CHANNELS:
+        options["channel"] = browser_name
+    if browser_name == "chromium" or browser_name in CHROMIUM_CHANNELS:
+        options["args"] = CHROMIUM_ARGS
+    return options
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser(playwright: Playwright):
+    """Launch ONE browser instance for the whole test session."""
+    browser = await _browser_type(playwright).launch(**_launch_options())
+    yield browser
+    await browser.close()
+
+
+async def _block_unneeded_requests(route: Route):
+    """Abort images, fonts, media and ad/analytics requests; continue the rest."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        host in request.url for host in BLOCKED_HOSTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
 
+async def _configure_context(context: BrowserContext) -> BrowserContext:
+    """Apply the shared timeouts and request routing to a context.
 
-@pytest.fixture
-async def context(browser: Browser):
-    """Create a new browser context for each test."""
-    context = await browser.new_context(
-        viewport={"width": 1280, "height": 720},
-    )
+    Note: routing disables the browser's HTTP cache for this context.
+    """
     context.set_default_navigation_timeout(20000)  # 20 seconds
     context.set_default_timeout(10000)  # 10 seconds for other actions
+    await context.route("**/*", _block_unneeded_requests)
+    return context
+
+
+async def _new_context(browser: Browser, **options) -> BrowserContext:
+    """Create an isolated browser context with the shared settings.
+
+    Extra keyword arguments are passed to ``browser.new_context()``.
+    """
+    context = await browser.new_context(**CONTEXT_OPTIONS, **options)
+    return await _configure_context(context)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(browser: Browser):
+    """Create a new browser context and page for each test.
+
+    The context isolates cookies and storage between tests; closing it also
+    closes its page, so no separate page teardown is needed.
+    """
+    context = await _new_context(browser)
+    page = await context.new_page()
+    yield page
+    await context.close()
+
 
-    yield context
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def github_page(browser: Browser):
+    """Navigate to the GitHub homepage ONCE and share the page within a module.
+
+    The homepage tests are read-only, so a single page load serves all of them.
+    """
+    context = await _new_context(browser)
+    page = await context.new_page()
+    await page.goto("https://github.com", wait_until="load", timeout=30000)
+    yield page
     await context.close()
 
 
-@pytest.fixture
-async def page(context: BrowserContext):
-    """Create a new page for each test."""
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def google_page(browser: Browser):
+    """Navigate to the Google homepage ONCE and share the page within a module.
+
+    The context is created from a storage state with Google's cookie consent
+    already accepted, so the dialog never appears.
+    """
+    context = await _new_context(browser, storage_state=GOOGLE_CONSENT_STATE)
     page = await context.new_page()
+    # /ncr ("no country redirect") keeps google.com instead of a country TLD
+    await page.goto("https://www.google.com/ncr", wait_until="load", timeout=30000)
     yield page
-    await page.close()
+    await context.close()
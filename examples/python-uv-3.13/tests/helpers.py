@@ -0,0 +1,14 @@
+"""Shared helpers for the Playwright tests (fixtures live in conftest.py)."""
+
+from playwright.async_api import Page
+
+# Single-call DOM presence check for a CSS selector
+HAS_MATCH_JS = "(sel) => document.querySelectorAll(sel).length > 0"
+
+
+async def has_match(page: Page, selector: str) -> bool:
+    """Return whether any element matches a CSS selector, in one driver round-trip.
+
+    Unlike a locator, this does not auto-wait, so use it on loaded pages only.
+    """
+    return await page.evaluate(HAS_MATCH_JS, selector)